@@ -2,8 +2,10 @@
 """
 NYT Spelling Bee Answers Scraper (Python)
 
-- Iterates through prioritized sources, using anti-bot headers and randomized delays.
-- Parses HTML using BeautifulSoup and a regex fallback.
+- Fetches prioritized sources concurrently, using anti-bot headers and randomized delays,
+  then accepts the highest-priority source that validates.
+- Parses list items straight from the markup (selectolax/lxml DOM as a fallback),
+  with a whole-page text + regex fallback.
 - Validates a result by requiring >= 15 words.
 - Deductive analysis:
   - findCenterLetter: letter present in every word
@@ -21,30 +23,48 @@ NYT Spelling Bee Answers Scraper (Python)
 }
 
 Notes:
-- Requires: requests, beautifulsoup4
+- Requires: requests, lxml (selectolax optional, for faster DOM parsing;
+  brotli optional, for br-compressed responses)
 """
 
+import os
 import sys
 import re
+import hashlib
+import socket
 import json
 import time
 import random
-import string
+import operator
+import threading
 import traceback
-from datetime import datetime, timezone, date as date_cls
-from typing import Callable, Dict, List, Optional, Tuple
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from functools import lru_cache, reduce
+from datetime import datetime, timedelta, timezone, date as date_cls
+from html import unescape
+from urllib.parse import urlsplit
+from typing import Callable, Dict, List, Optional, Tuple, TypeVar
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from lxml import etree, html as lxml_html
+
+try:
+    # Lexbor-backed DOM, faster than lxml for the list-item fallback and page text; optional
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
 
 # -----------------------------
 # Configuration
 # -----------------------------
 
-MONTHS = [
+MONTHS = (
     "january", "february", "march", "april", "may", "june",
     "july", "august", "september", "october", "november", "december"
-]
+)
 
 USER_AGENTS = [
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
@@ -53,7 +73,7 @@ USER_AGENTS = [
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.4.1 Safari/605.1.15",
 ]
 
-COMMON_BLOCKLIST = {
+COMMON_BLOCKLIST = frozenset({
     'HTML', 'HTTP', 'HTTPS', 'HEAD', 'BODY', 'SCRIPT', 'STYLE', 'META', 'JSON', 'AJAX', 'TYPE', 'NAME', 'CLASS', 'HREF', 'LINK', 'SPAN', 'DOCTYPE', 'CDATA', 'AICP',
     'TODAY', 'TODAYS', 'SPELLING', 'PUZZLE', 'ANSWERS', 'WORDS', 'GAME', 'LETTER', 'LETTERS', 'CENTER', 'PANGRAM', 'GENIUS', 'QUEEN', 'BEE',
     'SEPTEMBER', 'OCTOBER', 'NOVEMBER', 'DECEMBER', 'JANUARY', 'FEBRUARY', 'MARCH', 'APRIL', 'JUNE', 'JULY', 'AUGUST', 'MONDAY', 'TUESDAY',
@@ -61,7 +81,45 @@ COMMON_BLOCKLIST = {
     'COMMENTS', 'REPLY', 'EMAIL', 'WEBSITE', 'SUBSCRIBE', 'LOGIN', 'LOGOUT', 'REGISTER', 'SEARCH', 'POST', 'EDIT', 'DELETE', 'UPDATE', 'VIEW', 'SHARE',
     'USER', 'ADMIN', 'FORUM', 'BLOG', 'ARCHIVE', 'SOLVER', 'HINT', 'PRIME', 'FINDER', 'SBHINTS', 'SBANSWERS', 'SBARCHIVE', 'TECHWISER', 'GUIDE',
     'COPYRIGHT', 'POLICY', 'CONTACT', 'ABOUT', 'PRIVACY', 'TERMS', 'SERVICE', 'FOLLOW'
-}
+})
+
+# Unreachable hosts fail fast; `timeout` in fetch_html only bounds reads once connected
+CONNECT_TIMEOUT_SECONDS = 5
+
+# A source is accepted once a parser finds at least this many words
+MIN_ANSWERS = 15
+
+# Scraped results are cached per date so repeated runs on the same day skip the network,
+# and fetched pages are kept for reuse and conditional revalidation
+CACHE_DIR = os.environ.get("BEE_CACHE_DIR") or os.path.join(os.path.expanduser("~"), ".cache", "bee")
+RESULT_TTL_SECONDS = 6 * 60 * 60
+# Pages fetched this recently are reused without any request; kept short because some
+# source URLs are undated and change with the puzzle
+PAGE_TTL_SECONDS = 60 * 60
+# Stored pages (full HTML) untouched for this long are deleted once per run
+PAGE_MAX_AGE_SECONDS = 3 * 24 * 60 * 60
+
+# Bit for each letter in the 26-bit letter sets used by the deductive analysis
+LETTER_BITS = {chr(65 + i): 1 << i for i in range(26)}
+
+# Compiled once at import; the parsers run these over every page
+WORD_RE = re.compile(r"\b[A-Z]{4,15}\b")
+# List item contents up to the next item or the end of the list (closing </li> is optional in HTML),
+# or up to the end of the document when the list is never closed
+LI_RE = re.compile(r"<li\b[^>]*>(.*?)(?=</?li\b|</[ou]l\s*>|</(?:body|html)\s*>|\Z)", re.IGNORECASE | re.DOTALL)
+# Block containers: an unclosed list also ends where the block around it closes
+BLOCK_TAG_RE = re.compile(
+    r"<(/?)(?:div|section|article|main|aside|nav|header|footer|form|blockquote|table|tbody|tr|td|th)\b",
+    re.IGNORECASE,
+)
+# Markup whose contents are never page text: script/style blocks and comments
+NON_TEXT_RE = re.compile(r"<(script|style)\b.*?</\1\s*>|<!--.*?-->", re.IGNORECASE | re.DOTALL)
+# A tag starts with a name, "/", "!" or "?" (a bare "<" in text is not one). A quote right
+# after "=" opens an attribute value that may hold ">" but never runs past the next tag;
+# other quotes are plain characters. An unterminated tag runs to the end, so no backtracking
+TAG_RE = re.compile(r"""<[A-Za-z/!?](?:=\s*"[^"<]*"|=\s*'[^'<]*'|[^>])*(?:>|\Z)""")
+# Visible text under a node: script and style contents are skipped
+TEXT_XPATH = etree.XPath(".//text()[not(ancestor::script or ancestor::style)]")
 
 # -----------------------------
 # Utilities
@@ -70,31 +128,132 @@ COMMON_BLOCKLIST = {
 def log(msg: str) -> None:
     print(msg, file=sys.stderr)
 
-def rand_sleep(min_ms: int, max_ms: int) -> None:
-    time.sleep(random.uniform(min_ms, max_ms) / 1000.0)
-
 def today_utc() -> date_cls:
     return datetime.now(timezone.utc).date()
 
 def format_date(dt: date_cls) -> str:
     return dt.strftime("%Y-%m-%d")
 
-def unique_preserve_order(items: List[str]) -> List[str]:
-    seen = set()
-    out = []
-    for x in items:
-        if x not in seen:
-            out.append(x)
-            seen.add(x)
-    return out
+T = TypeVar("T")
+
+def unique_preserve_order(items: List[T]) -> List[T]:
+    return list(dict.fromkeys(items))
+
+# -----------------------------
+# Disk caches
+# -----------------------------
+
+def read_json_file(path: str) -> Optional[Dict]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return data if isinstance(data, dict) else None
+
+def write_json_file(path: str, data: Dict) -> None:
+    # Write through a per-thread temp file so concurrent writers never interleave
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp, path)
+    except OSError as e:
+        log(f"[WARN] Could not write cache {path}: {e}")
+
+def result_cache_path(d: date_cls) -> str:
+    return os.path.join(CACHE_DIR, f"{format_date(d)}.json")
+
+def read_cached_result(d: date_cls) -> Optional[Dict]:
+    return read_json_file(result_cache_path(d))
+
+def load_cached_result(d: date_cls, ttl: int = RESULT_TTL_SECONDS) -> Optional[Dict]:
+    try:
+        if time.time() - os.path.getmtime(result_cache_path(d)) > ttl:
+            return None
+    except OSError:
+        return None
+    cached = read_cached_result(d)
+    return cached if cached and cached.get("wordCount") else None
+
+def save_cached_result(d: date_cls, result_json: Dict) -> Dict:
+    # Never replace a cached result with a smaller one (or a failed run): the larger one is
+    # kept, its TTL restarted, and returned so the caller reports what the cache holds
+    existing = read_cached_result(d)
+    if existing and existing.get("wordCount", 0) > result_json.get("wordCount", 0):
+        try:
+            os.utime(result_cache_path(d))
+        except OSError:
+            pass
+        return existing
+    if result_json.get("wordCount"):
+        write_json_file(result_cache_path(d), result_json)
+    return result_json
+
+def http_cache_path(url: str) -> str:
+    return os.path.join(CACHE_DIR, "http", hashlib.sha1(url.encode("utf-8")).hexdigest() + ".json")
+
+def read_cached_page(url: str) -> Optional[Dict]:
+    cached = read_json_file(http_cache_path(url))
+    return cached if cached and cached.get("url") == url and cached.get("body") else None
+
+def cached_page_age(url: str) -> float:
+    # Seconds since the page was last fetched or revalidated (infinite when not cached)
+    try:
+        return time.time() - os.path.getmtime(http_cache_path(url))
+    except OSError:
+        return float("inf")
+
+def touch_cached_page(url: str) -> None:
+    # A 304 proves the stored body is current, so restart its freshness window
+    try:
+        os.utime(http_cache_path(url))
+    except OSError:
+        pass
+
+def prune_page_cache(max_age: float = PAGE_MAX_AGE_SECONDS) -> None:
+    # Also clears temp files left by fetches abandoned mid-write
+    cutoff = time.time() - max_age
+    try:
+        with os.scandir(os.path.join(CACHE_DIR, "http")) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_file() and entry.stat().st_mtime < cutoff:
+                        os.remove(entry.path)
+                except OSError:
+                    pass
+    except OSError:
+        pass
+
+def save_cached_page(url: str, resp: requests.Response, body: str) -> None:
+    write_json_file(http_cache_path(url), {
+        "url": url,
+        "etag": resp.headers.get("ETag"),
+        "last_modified": resp.headers.get("Last-Modified"),
+        "body": body,
+    })
 
 # -----------------------------
 # Fetch with anti-bot
 # -----------------------------
 
-def fetch_html(url: str, timeout: int = 20) -> Optional[str]:
-    headers = {
-        "User-Agent": random.choice(USER_AGENTS),
+class NoThrottleRetry(Retry):
+    # urllib3 retries any 413/429/503 carrying Retry-After; a throttled (429) host is not
+    # hit again, so the run falls through to the next source. 503 still honours Retry-After
+    RETRY_AFTER_STATUS_CODES = frozenset({503})
+
+def build_session() -> requests.Session:
+    # One pooled session for every fetch so connections are kept alive and reused
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=16,
+        max_retries=NoThrottleRetry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504], raise_on_status=False),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({
         "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
         "Accept-Language": "en-US,en;q=0.9",
         "Referer": "https://www.google.com/",
@@ -103,116 +262,213 @@ def fetch_html(url: str, timeout: int = 20) -> Optional[str]:
         "Sec-Fetch-Dest": "document",
         "Sec-Fetch-Mode": "navigate",
         "Sec-Fetch-Site": "cross-site",
-    }
+    })
+    return session
+
+SESSION = build_session()
+
+def warm_dns(url: str) -> None:
+    # Resolve the host ahead of the request so the lookup is answered from the resolver cache
+    parts = urlsplit(url)
+    if not parts.hostname:
+        return
     try:
-        rand_sleep(1000, 2500)
-        with requests.Session() as s:
-            resp = s.get(url, headers=headers, timeout=timeout, allow_redirects=True)
-            if resp.status_code == 200 and resp.text:
-                return resp.text
-            log(f"[HTTP-FAIL] {resp.status_code} from {url}")
+        socket.getaddrinfo(parts.hostname, parts.port or (443 if parts.scheme == "https" else 80), proto=socket.IPPROTO_TCP)
+    except (OSError, UnicodeError):
+        pass
+
+def fetch_html(url: str, timeout: int = 20, stop: Optional[threading.Event] = None,
+               fresh_for: float = PAGE_TTL_SECONDS) -> Optional[str]:
+    # Static headers live on SESSION; only the User-Agent is picked per request
+    headers = {"User-Agent": random.choice(USER_AGENTS)}
+    try:
+        # A page fetched within `fresh_for` seconds is served from disk: no jitter, no request
+        cached = read_cached_page(url)
+        if cached and cached_page_age(url) < fresh_for:
+            log(f"[CACHE] Fresh copy of {url}")
+            return cached["body"]
+        # Anti-bot jitter is measured from here, so the DNS warm-up happens inside it
+        deadline = time.monotonic() + random.uniform(1.0, 2.5)
+        warm_dns(url)
+        remaining = max(0.0, deadline - time.monotonic())
+        if stop is None:
+            time.sleep(remaining)
+        elif stop.wait(remaining):
+            # the caller no longer needs this page, so skip the request
             return None
+        # Revalidate a previously seen page so an unchanged one costs a 304 and no body
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+        resp = SESSION.get(url, headers=headers, timeout=(CONNECT_TIMEOUT_SECONDS, timeout), allow_redirects=True)
+        if resp.status_code == 304 and cached:
+            touch_cached_page(url)
+            return cached["body"]
+        if "charset=" not in resp.headers.get("Content-Type", "").lower():
+            # No declared charset: skip requests' Latin-1 default / body sniffing, the sites serve UTF-8
+            resp.encoding = "utf-8"
+        # Response.text decodes on every access, so read it once
+        body = resp.text if resp.status_code == 200 else ""
+        if body:
+            save_cached_page(url, resp, body)
+            return body
+        log(f"[HTTP-FAIL] {resp.status_code} from {url}")
+        return None
     except Exception as e:
         log(f"[NET-ERR] {e} from {url}")
         return None
 
+def fetch_in_background(url: str, **kwargs) -> "Future[Optional[str]]":
+    # A daemon thread per fetch: unlike executor workers, an abandoned in-flight
+    # request does not hold up interpreter exit once a run has its answer
+    future: "Future[Optional[str]]" = Future()
+    future.set_running_or_notify_cancel()
+
+    def run() -> None:
+        try:
+            future.set_result(fetch_html(url, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, daemon=True).start()
+    return future
+
 # -----------------------------
 # Parsers and Validators
 # -----------------------------
 
 def is_spelling_bee_word(word: str) -> bool:
+    # Validates arbitrary input; scan_words inlines the subset of checks its regex matches need
     if not word or not isinstance(word, str):
         return False
     w = word.strip().upper()
+    # cheapest checks first; after upper() an ASCII-only alphabetic word is exactly A-Z
     if len(w) < 4 or len(w) > 15:
         return False
-    if not re.fullmatch(r"[A-Z]+", w):
-        return False
     if w in COMMON_BLOCKLIST:
         return False
-    return True
+    return w.isascii() and w.isalpha()
+
+def scan_words(text: str) -> List[str]:
+    # Shared tokenizer for both parsers: uppercase, one regex pass, filtered and deduplicated.
+    # WORD_RE already guarantees 4-15 A-Z letters, so only the blocklist is left to check.
+    # Dedupe while streaming the matches (dicts keep first-seen order), then filter once
+    # per distinct word rather than once per occurrence
+    seen = dict.fromkeys(WORD_RE.findall(text.upper()))
+    blk = COMMON_BLOCKLIST
+    return [w for w in seen if w not in blk]
+
+def clip_list_item(item: str) -> str:
+    # Cut an item at the first block closing tag it did not open itself
+    depth = 0
+    for m in BLOCK_TAG_RE.finditer(item):
+        if not m.group(1):
+            depth += 1
+        elif depth:
+            depth -= 1
+        else:
+            return item[:m.start()]
+    return item
+
+def list_item_text(html: str) -> str:
+    # <li> contents straight from the markup, without building a DOM
+    # (scripts and comments go first, so list markup inside them is never read)
+    items = "\n".join(clip_list_item(item) for item in LI_RE.findall(NON_TEXT_RE.sub(" ", html)))
+    return unescape(TAG_RE.sub(" ", items))
+
+def page_text(html: str) -> str:
+    # Text of the whole page (script/style skipped). selectolax costs no more than the
+    # regex strip and reads malformed markup like a browser does; without it, the regex
+    # strip is much cheaper than an lxml tree
+    if LexborHTMLParser is not None:
+        dom = LexborHTMLParser(html)
+        dom.strip_tags(["script", "style"])
+        return dom.root.text(separator=" ") if dom.root else ""
+    return unescape(TAG_RE.sub(" ", NON_TEXT_RE.sub(" ", html)))
+
+def dom_list_item_text(html: str) -> str:
+    # <li> text from a real DOM (script/style skipped), one line per item
+    if LexborHTMLParser is not None:
+        dom = LexborHTMLParser(html)
+        dom.strip_tags(["script", "style"])
+        return "\n".join(li.text(separator=" ") for li in dom.tags("li"))
+    root = lxml_html.fromstring(html)
+    return "\n".join(" ".join(TEXT_XPATH(li)) for li in root.iter("li"))
 
 def generic_structured_parser(html: str) -> Dict[str, List[str]]:
     answers: List[str] = []
     try:
-        soup = BeautifulSoup(html, "html.parser")
-        for li in soup.find_all("li"):
-            text = li.get_text(separator=" ", strip=True)
-            if not text:
-                continue
-            w = text.strip().upper()
-            # keep only pure A-Z tokens in a list item (split in case of multiple words)
-            tokens = [t for t in re.findall(r"\b[A-Z]{4,15}\b", w)]
-            for t in tokens:
-                if is_spelling_bee_word(t):
-                    answers.append(t)
+        # keep only pure A-Z tokens from list items, scanning all items in a single pass
+        answers = scan_words(list_item_text(html))
+        if len(answers) < MIN_ANSWERS:
+            # too few hits for a real answer list: walk a real DOM in case the markup fooled the regex
+            answers = scan_words(dom_list_item_text(html))
     except Exception:
         # ignore parsing errors
         pass
-    return {"answers": unique_preserve_order(answers)}
+    return {"answers": answers}
 
 def generic_regex_parser(html: str) -> Dict[str, List[str]]:
     answers: List[str] = []
     try:
         # Pull text for more signal, then scan for uppercase words
-        soup = BeautifulSoup(html, "html.parser")
-        text = soup.get_text(separator=" ").upper()
-        words = re.findall(r"\b[A-Z]{4,15}\b", text)
-        for w in words:
-            if is_spelling_bee_word(w):
-                answers.append(w)
+        answers = scan_words(page_text(html))
     except Exception:
         pass
-    return {"answers": unique_preserve_order(answers)}
+    return {"answers": answers}
 
 def validate_result(result: Optional[Dict[str, List[str]]]) -> bool:
-    return bool(result and isinstance(result.get("answers"), list) and len(result["answers"]) >= 15)
+    return bool(result and isinstance(result.get("answers"), list) and len(result["answers"]) >= MIN_ANSWERS)
 
 # -----------------------------
 # Deductive logic
 # -----------------------------
 
-def find_center_letter(answers: List[str]) -> Optional[str]:
+def letter_mask(word: str) -> int:
+    # 26-bit set of the A-Z letters in a word (bit 0 = 'A'), so set tests become integer ops
+    bits = LETTER_BITS
+    mask = 0
+    for ch in word:
+        mask |= bits.get(ch, 0)
+    return mask
+
+def find_center_letter(answers: List[str], masks: Optional[List[int]] = None) -> Optional[str]:
     if not answers:
         return None
-    first = answers[0]
-    # preserve order of appearance in first word but unique
-    seen = set()
-    first_letters = []
-    for ch in first:
-        if ch not in seen:
-            seen.add(ch)
-            first_letters.append(ch)
-    for letter in first_letters:
-        if all(letter in w for w in answers):
-            return letter
+    common = reduce(operator.and_, masks if masks is not None else map(letter_mask, answers))
+    if common.bit_count() == 1:
+        return chr(64 + common.bit_length())
+    # several letters in every word: preserve order of appearance in first word
+    for ch in answers[0]:
+        if common & LETTER_BITS.get(ch, 0):
+            return ch
     return None
 
 def find_all_letters(answers: List[str]) -> Optional[str]:
     if not answers or len(answers) < 10:
         return None
-    counts: Dict[str, int] = {}
-    for word in answers:
-        for ch in word:
-            if ch in string.ascii_uppercase:
-                counts[ch] = counts.get(ch, 0) + 1
-    if not counts:
+    counts = Counter("".join(answers))
+    letters = [ch for ch in counts if "A" <= ch <= "Z"]
+    if not letters:
         return None
     # Sort by frequency desc, then alphabetically to stabilize ties
-    sorted_letters = sorted(counts.keys(), key=lambda c: (-counts[c], c))
+    sorted_letters = sorted(letters, key=lambda c: (-counts[c], c))
     if len(sorted_letters) >= 7:
         top7 = sorted(sorted_letters[:7])
         return "".join(top7)
     return None
 
-def find_pangrams(answers: List[str], letters: Optional[str]) -> List[str]:
+def find_pangrams(answers: List[str], letters: Optional[str], masks: Optional[List[int]] = None) -> List[str]:
     if not answers or not letters or len(letters) != 7:
         return []
-    req = set(letters)
+    req = letter_mask(letters)
+    if masks is None:
+        masks = [letter_mask(w) for w in answers]
     pangrams = []
-    for w in answers:
-        wl = set(w)
-        if len(wl) >= 7 and req.issubset(wl):
+    for w, wm in zip(answers, masks):
+        if wm & req == req and wm.bit_count() >= 7:
             pangrams.append(w)
     return pangrams
 
@@ -221,18 +477,20 @@ def find_pangrams(answers: List[str], letters: Optional[str]) -> List[str]:
 # -----------------------------
 
 class Source:
-    def __init__(self, name: str, build_url: Callable[[date_cls], str], parsers: List[Callable[[str], Dict[str, List[str]]]]):
+    # Each parser maps page HTML to {"answers": [...]} holding uppercase A-Z words;
+    # an undated source always shows the current puzzle, so it only serves today
+    def __init__(self, name: str, build_url: Callable[[date_cls], str], parsers: List[Callable[[str], Dict[str, List[str]]]],
+                 dated: bool = True):
         self.name = name
         self.build_url = build_url
         self.parsers = parsers
+        self.dated = dated
 
-def sources_config() -> List[Source]:
+@lru_cache(maxsize=None)
+def sources_config() -> Tuple[Source, ...]:
+    # Sources don't depend on the date (only their URLs do), so build them once per process
     def spelling_bee_times(d: date_cls) -> str:
-        m_idx = d.month - 1
-        day = f"{d.day:02d}"
-        y = d.year
-        month_str = f"{d.month:02d}"
-        return f"https://spellingbeetimes.com/{y}/{month_str}/{day}/new-york-times-nyt-spelling-bee-answers-and-solution-for-{MONTHS[m_idx]}-{int(day)}-{y}/"
+        return f"https://spellingbeetimes.com/{d:%Y/%m/%d}/new-york-times-nyt-spelling-bee-answers-and-solution-for-{MONTHS[d.month - 1]}-{d.day}-{d.year}/"
 
     def techwiser(d: date_cls) -> str:
         return f"https://techwiser.com/todays-nyt-spelling-bee-answers-for-{MONTHS[d.month - 1]}-{d.day}-{d.year}/"
@@ -253,62 +511,78 @@ def sources_config() -> List[Source]:
         return f"https://www.reddit.com/r/NYTSpellingBee/search/?q=Official%20{d.strftime('%Y-%m-%d')}&restrict_sr=1&sort=new"
 
     parsers = [generic_structured_parser, generic_regex_parser]
-    return [
+    return (
         Source("SpellingBeeTimes", spelling_bee_times, parsers),
         Source("Techwiser", techwiser, parsers),
         Source("SBHints", sbhints, parsers),
         Source("PuzzlePrime", puzzleprime, parsers),
-        Source("SBSolver", sbsolver, parsers),
-        Source("NYT Official Yesterday", nyt_official_yesterday, parsers),
+        Source("SBSolver", sbsolver, parsers, dated=False),
+        Source("NYT Official Yesterday", nyt_official_yesterday, parsers, dated=False),
         Source("Reddit", reddit, parsers),
-    ]
+    )
 
 # -----------------------------
 # Main scraping flow
 # -----------------------------
 
-def scrape_for_date(d: date_cls) -> Tuple[Optional[Dict], List[str]]:
+def scrape_for_date(d: date_cls, force: bool = False) -> Tuple[Optional[Dict], List[str]]:
     log_summary: List[str] = []
     best_result: Optional[Dict[str, List[str]]] = None
     best_source: Optional[str] = None
 
-    for src in sources_config():
-        try:
+    # Undated sources would report today's puzzle for any other date
+    is_today = d == today_utc()
+    sources = [src for src in sources_config() if src.dated or is_today]
+    stop = threading.Event()
+    try:
+        # Sources are independent hosts, so fetch them all at once
+        futures = []
+        for src in sources:
             url = src.build_url(d)
             log(f"[TRY] {src.name} | {url}")
-            html = fetch_html(url)
-            if not html:
-                log_summary.append(f"{src.name}: HTTP FAIL")
-                rand_sleep(1500, 3000)
-                continue
-
-            result: Optional[Dict[str, List[str]]] = None
-            for parser in src.parsers:
-                result = parser(html)
+            futures.append(fetch_in_background(url, stop=stop, fresh_for=0 if force else PAGE_TTL_SECONDS))
+
+        # Consume in priority order so the highest-ranked valid source still wins
+        for src, future in zip(sources, futures):
+            try:
+                html = future.result()
+                if not html:
+                    log_summary.append(f"{src.name}: HTTP FAIL")
+                    continue
+
+                result: Optional[Dict[str, List[str]]] = None
+                for parser in src.parsers:
+                    result = parser(html)
+                    if validate_result(result):
+                        break
+
                 if validate_result(result):
+                    answers = result["answers"]
+                    log(f"[FOUND] {len(answers)} answers from {src.name}")
+                    best_result = {"answers": answers}
+                    best_source = src.name
                     break
-
-            if validate_result(result):
-                answers = result["answers"]
-                log(f"[FOUND] {len(answers)} answers from {src.name}")
-                best_result = {"answers": answers}
-                best_source = src.name
-                break
-            else:
-                wc = len(result["answers"]) if result and "answers" in result else 0
-                log_summary.append(f"{src.name}: PARSE/VALIDATION FAIL (Found {wc} words)")
-        except Exception as e:
-            log(f"[ERROR] Unhandled exception in source {src.name}: {e}")
-            traceback.print_exc(file=sys.stderr)
-            log_summary.append(f"{src.name}: SCRIPT ERROR")
-        finally:
-            rand_sleep(1500, 3000)
+                else:
+                    wc = len(result["answers"]) if result and "answers" in result else 0
+                    log_summary.append(f"{src.name}: PARSE/VALIDATION FAIL (Found {wc} words)")
+            except Exception as e:
+                log(f"[ERROR] Unhandled exception in source {src.name}: {e}")
+                traceback.print_exc(file=sys.stderr)
+                log_summary.append(f"{src.name}: SCRIPT ERROR")
+
+    finally:
+        # Once a source has won, don't wait on lower-priority fetches: those still in
+        # their jitter sleep return without a request, and in-flight ones are abandoned
+        stop.set()
 
     if best_result:
-        answers = [w.upper() for w in best_result["answers"]]
-        center = find_center_letter(answers) or ""
+        # parsers emit uppercase words (scan_words folds case once per page), so no per-word upper() here
+        answers = best_result["answers"]
+        # letter sets are computed once and shared by the center and pangram checks
+        masks = [letter_mask(w) for w in answers]
+        center = find_center_letter(answers, masks) or ""
         letters = find_all_letters(answers) or ""
-        pangrams = find_pangrams(answers, letters)
+        pangrams = find_pangrams(answers, letters, masks)
         # Deduplicate and sort for stable output
         answers = sorted(unique_preserve_order(answers))
         pangrams = sorted(unique_preserve_order(pangrams))
@@ -336,26 +610,63 @@ def scrape_for_date(d: date_cls) -> Tuple[Optional[Dict], List[str]]:
     }
     return result_json, log_summary
 
-def parse_cli_date() -> Optional[date_cls]:
-    # Optional CLI argument: --date YYYY-MM-DD
-    # If provided, use that date; otherwise use today UTC
+def scrape_with_cache(d: date_cls, force: bool = False) -> Dict:
+    cached = None if force else load_cached_result(d)
+    if cached:
+        log(f"[CACHE] Using cached result from {result_cache_path(d)}")
+        return cached
+    result_json, _log = scrape_for_date(d, force)
+    return save_cached_result(d, result_json)
+
+def scrape_range(start: date_cls, end: date_cls, force: bool = False, max_workers: int = 8) -> List[Dict]:
+    # Backfill helper: dates are independent, so scrape several at once and return them in date order
+    if end < start:
+        raise ValueError(f"range end {format_date(end)} is before its start {format_date(start)}")
+    days = [start + timedelta(days=i) for i in range((end - start).days + 1)]
+    results: Dict[date_cls, Dict] = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(scrape_with_cache, d, force): d for d in days}
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+    return [results[d] for d in days]
+
+def parse_cli_date(flag: str = "--date") -> Optional[date_cls]:
+    # Optional CLI arguments: --date YYYY-MM-DD [--end YYYY-MM-DD]
+    # If --date is not provided, use today UTC; --end turns the run into a range
     argv = sys.argv[1:]
     if not argv:
         return None
     for i, a in enumerate(argv):
-        if a == "--date" and i + 1 < len(argv):
+        if a == flag and i + 1 < len(argv):
             try:
                 return datetime.strptime(argv[i + 1], "%Y-%m-%d").date()
             except ValueError:
-                log(f"[WARN] Invalid date format for --date: {argv[i + 1]} (expected YYYY-MM-DD)")
+                log(f"[WARN] Invalid date format for {flag}: {argv[i + 1]} (expected YYYY-MM-DD)")
     return None
 
 def main() -> None:
-    target_date = parse_cli_date() or today_utc()
-    log(f"[START] Scraper for {format_date(target_date)}")
+    # Once per run rather than per stored page: a backfill stores hundreds of pages
+    prune_page_cache()
+    start_date = parse_cli_date()
+    target_date = start_date or today_utc()
+    end_date = parse_cli_date("--end")
+    force = "--force" in sys.argv[1:]
+
+    if end_date:
+        if start_date is None:
+            log("[ERROR] --end needs a start date: pass --date YYYY-MM-DD as well")
+            sys.exit(2)
+        if end_date < start_date:
+            log(f"[ERROR] --end {format_date(end_date)} is before --date {format_date(start_date)}")
+            sys.exit(2)
+        log(f"[START] Scraper for {format_date(target_date)} to {format_date(end_date)}")
+        results = scrape_range(target_date, end_date, force)
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+        return
 
-    result_json, _log = scrape_for_date(target_date)
+    log(f"[START] Scraper for {format_date(target_date)}")
+    result_json = scrape_with_cache(target_date, force)
     print(json.dumps(result_json, ensure_ascii=False, indent=2))
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()